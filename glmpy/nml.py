@@ -1,5 +1,10 @@
+from __future__ import annotations
+
+import inspect
 import warnings
 
+import numpy as np
+
 from typing import Union, List, Any, Callable
 
 class NML:
@@ -176,41 +181,17 @@ class NML:
         --------
         >>> nml_file.write_nml(nml_file_path="my_lake.nml")
         """
-        nml_string = ""
-
-        if self.glm_setup is not None:
-            nml_string += self._write_nml_glm_setup(self.glm_setup) + "\n"
-        if self.mixing is not None:
-            nml_string += self._write_nml_mixing(self.mixing) + "\n"
-        if self.wq_setup is not None:
-            nml_string += self._write_nml_wq_setup(self.wq_setup) + "\n"
-        if self.morphometry is not None:
-            nml_string += self._write_nml_morphometry(self.morphometry) + "\n"
-        if self.time is not None:
-            nml_string += self._write_nml_time(self.time) + "\n"
-        if self.output is not None:
-            nml_string += self._write_nml_output(self.output) + "\n"
-        if self.init_profiles is not None:
-            nml_string += self._write_nml_init_profiles(
-                self.init_profiles
-            ) + "\n"
-        if self.light is not None:
-            nml_string += self._write_nml_light(self.light) + "\n"
-        if self.bird_model is not None:
-            nml_string += self._write_nml_bird_model(self.bird_model) + "\n"
-        if self.sediment is not None:
-            nml_string += self._write_nml_sediment(self.sediment) + "\n"
-        if self.snow_ice is not None:
-            nml_string += self._write_nml_snow_ice(self.snow_ice) + "\n"
-        if self.meteorology is not None:
-            nml_string += self._write_nml_meteorology(self.meteorology) + "\n"
-        if self.inflow is not None:
-            nml_string += self._write_nml_inflow(self.inflow) + "\n"
-        if self.outflow is not None:
-            nml_string += self._write_nml_outflow(self.outflow) + "\n"
-        
+        # Render every block before opening the file so that an error while
+        # rendering leaves an existing file untouched.
+        nml_blocks = []
+        for block_name, attr in _NML_BLOCKS:
+            block = getattr(self, attr)
+            if block is not None:
+                nml_blocks.append(self._write_nml_block(block_name, block))
+                nml_blocks.append("\n")
+
         with open(file=nml_file_path, mode="w") as file:
-            file.write(nml_string)
+            file.writelines(nml_blocks)
 
     @staticmethod
     def nml_bool(python_bool: bool) -> str:
@@ -287,16 +268,10 @@ class NML:
         >>> print(list)
         .true.,.false.,.true.
         """
-        if len(python_list) == 1:
-            if syntax_func is not None:
-                return syntax_func(python_list[0])
-            else:
-                return str(python_list[0])
+        if syntax_func is not None:
+            return ','.join(map(syntax_func, python_list))
         else:
-            if syntax_func is not None:
-                return ','.join(syntax_func(val) for val in python_list)
-            else:
-                return ','.join(str(val) for val in python_list)
+            return ','.join(map(str, python_list))
 
     @staticmethod
     def nml_param_val(
@@ -349,382 +324,292 @@ class NML:
         else:
             return ""
     
-    def _write_nml_glm_setup(self, glm_setup: dict) -> str:
+    def _write_nml_block(self, block_name: str, block: dict) -> str:
         """
-        Construct a string of the `&glm_setup` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        glm_setup_str = (
-            "&glm_setup\n" +
-            self.nml_param_val(glm_setup, "sim_name", self.nml_str) +
-            self.nml_param_val(glm_setup, "max_layers") +
-            self.nml_param_val(glm_setup, "min_layer_vol") +
-            self.nml_param_val(glm_setup, "min_layer_thick") +
-            self.nml_param_val(glm_setup, "max_layer_thick") +
-            self.nml_param_val(glm_setup, "density_model") +
-            self.nml_param_val(glm_setup, "non_avg", self.nml_bool) +
-            "/"
-        )
-
-        return glm_setup_str
-    
-    def _write_nml_mixing(self, mixing: dict) -> str:
-        """
-        Construct a string of the `&mixing` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        mixing_str = (
-            "&mixing\n" +
-            self.nml_param_val(mixing, "surface_mixing") +
-            self.nml_param_val(mixing, "coef_mix_conv") +
-            self.nml_param_val(mixing, "coef_wind_stir") +
-            self.nml_param_val(mixing, "coef_mix_shear") +
-            self.nml_param_val(mixing, "coef_mix_turb") +
-            self.nml_param_val(mixing, "coef_mix_KH") +
-            self.nml_param_val(mixing, "deep_mixing") +
-            self.nml_param_val(mixing, "coef_mix_hyp") +
-            self.nml_param_val(mixing, "diff") +
-            "/"
-        )
-
-        return mixing_str
-
-    def _write_nml_wq_setup(self, wq_setup: dict) -> str:
-        """
-        Construct a string of the `&wq_setup` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        wq_setup_str = (
-            "&wq_setup\n" +
-            self.nml_param_val(wq_setup, "wq_lib", self.nml_str) +
-            self.nml_param_val(wq_setup, "wq_nml_file", self.nml_str) +
-            self.nml_param_val(
-                wq_setup, "bioshade_feedback", self.nml_bool
-            ) +
-            self.nml_param_val(wq_setup, "mobility_off", self.nml_bool)+
-            self.nml_param_val(wq_setup, "ode_method") +
-            self.nml_param_val(wq_setup, "split_factor") +
-            self.nml_param_val(wq_setup, "repair_state", self.nml_bool) +
-            "/"
-        )
-
-        return wq_setup_str
-    
-    def _write_nml_morphometry(self, morphometry: dict) -> str:
-        """
-        Construct a string of the `&morphometry` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        morphometry_str = (
-            "&morphometry\n" +
-            self.nml_param_val(morphometry, "lake_name", self.nml_str) +
-            self.nml_param_val(morphometry, "latitude") +
-            self.nml_param_val(morphometry, "longitude") +
-            self.nml_param_val(morphometry, "base_elev") +
-            self.nml_param_val(morphometry, "crest_elev") +
-            self.nml_param_val(morphometry, "bsn_len") +
-            self.nml_param_val(morphometry, "bsn_wid") +
-            self.nml_param_val(morphometry, "bsn_vals") +
-            self.nml_param_val(morphometry, "H", self.nml_list) +
-            self.nml_param_val(morphometry, "A", self.nml_list) +
-            "/"
-        )
-
-        return morphometry_str
-
-    def _write_nml_time(self, time: dict) -> str:
-        """
-        Construct a string of the `&time` model configuration block. Private 
-        method for use in generating `.nml` files.
-        """
-        time_str = (
-            "&time\n" +
-            self.nml_param_val(time, "timefmt") +
-            self.nml_param_val(time, "start", self.nml_str) +
-            self.nml_param_val(time, "stop", self.nml_str) +
-            self.nml_param_val(time, "dt") +
-            self.nml_param_val(time, "num_days") +
-            self.nml_param_val(time, "timezone") +
-            "/"
-        )
-
-        return time_str
-
-    def _write_nml_output(self, output: dict) -> str:
-        """
-        Construct a string of the `&output` model configuration block. Private 
-        method for use in generating `.nml` files.
-        """
-        output_str = (
-            "&output\n" +
-            self.nml_param_val(output, "out_dir", self.nml_str) +
-            self.nml_param_val(output, "out_fn", self.nml_str) +
-            self.nml_param_val(output, "nsave") +
-            self.nml_param_val(output, "csv_lake_fname", self.nml_str) +
-            self.nml_param_val(output, "csv_point_nlevs") +
-            self.nml_param_val(output, "csv_point_fname", self.nml_str) +
-            self.nml_param_val(output, "csv_point_frombot", self.nml_list) +
-            self.nml_param_val(output, "csv_point_at", self.nml_list) +
-            self.nml_param_val(output, "csv_point_nvars") +
-            self.nml_param_val(
-                output, 
-                "csv_point_vars", 
-                lambda x: self.nml_list(x, self.nml_str)
-            ) +
-            self.nml_param_val(
-                output, "csv_outlet_allinone", self.nml_bool
-            ) +
-            self.nml_param_val(output, "csv_outlet_fname", self.nml_str) +
-            self.nml_param_val(output, "csv_outlet_nvars") +
-            self.nml_param_val(
-                output, 
-                "csv_outlet_vars", 
-                lambda x: self.nml_list(x, self.nml_str)
-            ) +
-            self.nml_param_val(output, "csv_ovrflw_fname", self.nml_str) +
-            "/"
-        )
-
-        return output_str
-
-    def _write_nml_init_profiles(self, init_profiles: dict) -> str:
-        """
-        Construct a string of the `&init_profiles` model configuration block.
-        Private method for use in generating `.nml` files.
-        """
-        init_profiles_str = (
-            "&init_profiles\n" +
-            self.nml_param_val(init_profiles, "lake_depth") +
-            self.nml_param_val(init_profiles, "num_depths") +
-            self.nml_param_val(init_profiles, "the_depths", self.nml_list) +
-            self.nml_param_val(init_profiles, "the_temps", self.nml_list) +
-            self.nml_param_val(init_profiles, "the_sals", self.nml_list) +
-            self.nml_param_val(init_profiles, "num_wq_vars") +
-            self.nml_param_val(
-                init_profiles, 
-                "wq_names", 
-                lambda x: self.nml_list(x, self.nml_str)
-            ) +
-            self.nml_param_val(
-                init_profiles, "wq_init_vals", self.nml_list
-            ) +
-            "/"
-        )
-
-        return init_profiles_str
-
-    def _write_nml_light(self, light: dict) -> str:
-        """
-        Construct a string of the `&light` model configuration block. Private 
-        method for use in generating `.nml` files.
-        """
-        light_str = (
-            "&light\n" +
-            self.nml_param_val(light, "light_mode") +
-            self.nml_param_val(light, "Kw") +
-            self.nml_param_val(light, "Kw_file", self.nml_str) +
-            self.nml_param_val(light, "n_bands") +
-            self.nml_param_val(light, "light_extc", self.nml_list) +
-            self.nml_param_val(light, "energy_frac", self.nml_list) +
-            self.nml_param_val(light, "Benthic_Imin") +
-            "/"
-        )
-
-        return light_str
-    
-    def _write_nml_bird_model(self, bird_model: dict) -> str:
-        """
-        Construct a string of the `&bird_model` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        bird_model_str = (
-            "&bird_model\n" +
-            self.nml_param_val(bird_model, "AP") +
-            self.nml_param_val(bird_model, "Oz") +
-            self.nml_param_val(bird_model, "WatVap") +
-            self.nml_param_val(bird_model, "AOD500") +
-            self.nml_param_val(bird_model, "AOD380") +
-            self.nml_param_val(bird_model, "Albedo") +
-            "/"
-        )
-
-        return bird_model_str    
-    
-    def _write_nml_sediment(self, sediment: dict) -> str:
+        Construct a string of a model configuration block from the parameters 
+        listed for it in `_NML_BLOCK_LINES`. Private method for use in 
+        generating `.nml` files.
         """
-        Construct a string of the `&sediment` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        sediment_str = (
-            "&sediment\n" +
-            self.nml_param_val(sediment, "sed_heat_Ksoil") +
-            self.nml_param_val(sediment, "sed_temp_depth") +
-            self.nml_param_val(sediment, "sed_temp_mean", self.nml_list) +
-            self.nml_param_val(
-                sediment, "sed_temp_amplitude", self.nml_list
-            ) +
-            self.nml_param_val(
-                sediment, "sed_temp_peak_doy", self.nml_list
-            ) +
-            self.nml_param_val(sediment, "benthic_mode") +
-            self.nml_param_val(sediment, "n_zones") +
-            self.nml_param_val(sediment, "zone_heights", self.nml_list) +
-            self.nml_param_val(sediment, "sed_reflectivity", self.nml_list) +
-            self.nml_param_val(sediment, "sed_roughness", self.nml_list) +            
-            "/"
-        )
-
-        return sediment_str
-
-    def _write_nml_snow_ice(self, snow_ice: dict) -> str:
-        """
-        Construct a string of the `&snowice` model configuration block. Private 
-        method for use in generating `.nml` files.
-        """
-        snow_ice_str = (
-            "&snowice\n" +
-            self.nml_param_val(snow_ice, "snow_albedo_factor") +
-            self.nml_param_val(snow_ice, "snow_rho_min") +
-            self.nml_param_val(snow_ice, "snow_rho_max") +
-            "/"
-        )
+        block_lines = [_NML_BLOCK_HEADERS[block_name]]
+        for param, prefix, syntax_func in _NML_BLOCK_LINES[block_name]:
+            value = block[param]
+            if value is None:
+                continue
+            if syntax_func is not None:
+                value = syntax_func(value)
+            block_lines.append(f"{prefix}{value}\n")
+        block_lines.append(_NML_BLOCK_FOOTER)
 
-        return snow_ice_str
+        return "".join(block_lines)
 
-    def _write_nml_meteorology(self, meteorology: dict) -> str:
-        """
-        Construct a string of the `&meteorology` model configuration block. 
-        Private method for use in generating `.nml` files.
-        """
-        meteorology_str = (
-            "&meteorology\n" +
-            self.nml_param_val(meteorology, "met_sw", self.nml_bool) +
-            self.nml_param_val(meteorology, "meteo_fl", self.nml_str) +
-            self.nml_param_val(meteorology, "subdaily", self.nml_bool) +
-            self.nml_param_val(meteorology, "time_fmt", self.nml_str) +
-            self.nml_param_val(meteorology, "rad_mode") +
-            self.nml_param_val(meteorology, "albedo_mode") +
-            self.nml_param_val(meteorology, "sw_factor") +
-            self.nml_param_val(meteorology, "lw_type", self.nml_str) +
-            self.nml_param_val(meteorology, "cloud_mode") +
-            self.nml_param_val(meteorology, "lw_factor") +
-            self.nml_param_val(meteorology, "atm_stab") +
-            self.nml_param_val(meteorology, "rh_factor") +
-            self.nml_param_val(meteorology, "at_factor") +
-            self.nml_param_val(meteorology, "ce") +
-            self.nml_param_val(meteorology, "ch") +
-            self.nml_param_val(meteorology, "rain_sw", self.nml_bool) +
-            self.nml_param_val(meteorology, "rain_factor") +
-            self.nml_param_val(meteorology, "catchrain", self.nml_bool) +
-            self.nml_param_val(meteorology, "rain_threshold") +
-            self.nml_param_val(meteorology, "runoff_coef") +
-            self.nml_param_val(meteorology, "cd") +
-            self.nml_param_val(meteorology, "wind_factor") +
-            self.nml_param_val(meteorology, "fetch_mode") +
-            self.nml_param_val(meteorology, "Aws") +
-            self.nml_param_val(meteorology, "Xws") +
-            self.nml_param_val(meteorology, "num_dir") +
-            self.nml_param_val(meteorology, "wind_dir") +
-            self.nml_param_val(meteorology, "fetch_scale") +
-            "/"
-        )
-
-        return meteorology_str
-
-    def _write_nml_inflow(self, inflow: dict) -> str:
-        """
-        Construct a string of the `&inflow` model configuration block. Private 
-        method for use in generating `.nml` files.
-        """
-        inflow_str = (
-            "&inflow\n" +
-            self.nml_param_val(inflow, "num_inflows") +
-            self.nml_param_val(
-                inflow, 
-                "names_of_strms", 
-                lambda x: self.nml_list(x, self.nml_str)
-            ) +
-            self.nml_param_val(
-                inflow, 
-                "subm_flag", 
-                lambda x: self.nml_list(x, self.nml_bool)
-            ) +
-            self.nml_param_val(inflow, "strm_hf_angle", self.nml_list) +
-            self.nml_param_val(inflow, "strmbd_slope", self.nml_list) +
-            self.nml_param_val(inflow, "strmbd_drag", self.nml_list) +
-            self.nml_param_val(inflow, "coef_inf_entrain", self.nml_list) +
-            self.nml_param_val(inflow, "inflow_factor", self.nml_list) +
-            self.nml_param_val(
-                inflow, 
-                "inflow_fl", 
-                lambda x: self.nml_list(x, self.nml_str)
-            ) +
-            self.nml_param_val(inflow, "inflow_varnum") +
-            self.nml_param_val(
-                inflow, 
-                "inflow_vars", 
-                lambda x: self.nml_list(x, self.nml_str)
-            ) +
-            self.nml_param_val(inflow, "time_fmt", self.nml_str) +
-            "/"
-        )
-
-        return inflow_str
-
-    def _write_nml_outflow(self, outflow: dict) -> str:
-        """
-        Construct a string of the `&outflow` model configuration block. Private 
-        method for use in generating `.nml` files.
-        """
-        outflow_str = (
-            "&outflow\n" +
-            self.nml_param_val(outflow, "num_outlet")+
-            self.nml_param_val(outflow, "outflow_fl", self.nml_str) +
-            self.nml_param_val(outflow, "time_fmt", self.nml_str) +
-            self.nml_param_val(outflow, "outflow_factor", self.nml_list) +
-            self.nml_param_val(
-                outflow, "outflow_thick_limit", self.nml_list
-            ) +
-            self.nml_param_val(
-                outflow, 
-                "single_layer_draw", 
-                lambda x: self.nml_list(x, self.nml_bool)
-            ) +
-            self.nml_param_val(
-                outflow, 
-                "flt_off_sw", 
-                lambda x: self.nml_list(x, self.nml_bool)
-            ) +
-            self.nml_param_val(outflow, "outlet_type", self.nml_list) +
-            self.nml_param_val(outflow, "outl_elvs", self.nml_list) +
-            self.nml_param_val(outflow, "bsn_len_outl", self.nml_list) +
-            self.nml_param_val(outflow, "bsn_wid_outl", self.nml_list) +
-            self.nml_param_val(outflow, "crit_O2") +
-            self.nml_param_val(outflow, "crit_O2_dep") +
-            self.nml_param_val(outflow, "crit_O2_days") +
-            self.nml_param_val(outflow, "outlet_crit") +
-            self.nml_param_val(outflow, "O2name", self.nml_str) +
-            self.nml_param_val(outflow, "O2idx", self.nml_str) +
-            self.nml_param_val(outflow, "target_temp") +
-            self.nml_param_val(outflow, "min_lake_temp") +
-            self.nml_param_val(outflow, "fac_range_upper") +
-            self.nml_param_val(outflow, "fac_range_lower") +
-            self.nml_param_val(outflow, "mix_withdraw", self.nml_bool) +
-            self.nml_param_val(outflow, "coupl_oxy_sw", self.nml_bool) +
-            self.nml_param_val(outflow, "withdrTemp_fl", self.nml_str) +
-            self.nml_param_val(outflow, "seepage", self.nml_bool) +
-            self.nml_param_val(outflow, "seepage_rate") +
-            self.nml_param_val(outflow, "crest_width") +
-            self.nml_param_val(outflow, "crest_factor") +
-            "/"
-        )
-
-        return outflow_str
+def _nml_str_list(python_list: List[Any]) -> str:
+    """
+    Equivalent to `NML.nml_list(python_list, syntax_func=NML.nml_str)` but
+    quotes the whole list in a single join rather than once per item.
+    """
+    if len(python_list) == 0:
+        return ""
+    return "'" + "','".join(map(str, python_list)) + "'"
+
+def _nml_bool_list(python_list: List[Any]) -> str:
+    """
+    Equivalent to `NML.nml_list(python_list, syntax_func=NML.nml_bool)` but
+    converts the items without a function call per item.
+    """
+    return ",".join(
+        [".true." if item is True else ".false." for item in python_list]
+    )
+
+# Configuration blocks in the order they are written to the `.nml` file, each
+# paired with the `NML` attribute that holds its parameters.
+_NML_BLOCKS = (
+    ("glm_setup", "glm_setup"),
+    ("mixing", "mixing"),
+    ("wq_setup", "wq_setup"),
+    ("morphometry", "morphometry"),
+    ("time", "time"),
+    ("output", "output"),
+    ("init_profiles", "init_profiles"),
+    ("light", "light"),
+    ("bird_model", "bird_model"),
+    ("sediment", "sediment"),
+    ("snowice", "snow_ice"),
+    ("meteorology", "meteorology"),
+    ("inflow", "inflow"),
+    ("outflow", "outflow")
+)
+
+# Parameters of each configuration block in the order they are written to the
+# `.nml` file. Each parameter is paired with the function used to format its
+# value, or `None` to write the value as-is. Built once at import so that
+# `NML._write_nml_block()` does not rebuild formatters for every block.
+_NML_BLOCK_PARAMS = {
+    "glm_setup": (
+        ("sim_name", NML.nml_str),
+        ("max_layers", None),
+        ("min_layer_vol", None),
+        ("min_layer_thick", None),
+        ("max_layer_thick", None),
+        ("density_model", None),
+        ("non_avg", NML.nml_bool)
+    ),
+    "mixing": (
+        ("surface_mixing", None),
+        ("coef_mix_conv", None),
+        ("coef_wind_stir", None),
+        ("coef_mix_shear", None),
+        ("coef_mix_turb", None),
+        ("coef_mix_KH", None),
+        ("deep_mixing", None),
+        ("coef_mix_hyp", None),
+        ("diff", None)
+    ),
+    "wq_setup": (
+        ("wq_lib", NML.nml_str),
+        ("wq_nml_file", NML.nml_str),
+        ("bioshade_feedback", NML.nml_bool),
+        ("mobility_off", NML.nml_bool),
+        ("ode_method", None),
+        ("split_factor", None),
+        ("repair_state", NML.nml_bool)
+    ),
+    "morphometry": (
+        ("lake_name", NML.nml_str),
+        ("latitude", None),
+        ("longitude", None),
+        ("base_elev", None),
+        ("crest_elev", None),
+        ("bsn_len", None),
+        ("bsn_wid", None),
+        ("bsn_vals", None),
+        ("H", NML.nml_list),
+        ("A", NML.nml_list)
+    ),
+    "time": (
+        ("timefmt", None),
+        ("start", NML.nml_str),
+        ("stop", NML.nml_str),
+        ("dt", None),
+        ("num_days", None),
+        ("timezone", None)
+    ),
+    "output": (
+        ("out_dir", NML.nml_str),
+        ("out_fn", NML.nml_str),
+        ("nsave", None),
+        ("csv_lake_fname", NML.nml_str),
+        ("csv_point_nlevs", None),
+        ("csv_point_fname", NML.nml_str),
+        ("csv_point_frombot", NML.nml_list),
+        ("csv_point_at", NML.nml_list),
+        ("csv_point_nvars", None),
+        ("csv_point_vars", _nml_str_list),
+        ("csv_outlet_allinone", NML.nml_bool),
+        ("csv_outlet_fname", NML.nml_str),
+        ("csv_outlet_nvars", None),
+        ("csv_outlet_vars", _nml_str_list),
+        ("csv_ovrflw_fname", NML.nml_str)
+    ),
+    "init_profiles": (
+        ("lake_depth", None),
+        ("num_depths", None),
+        ("the_depths", NML.nml_list),
+        ("the_temps", NML.nml_list),
+        ("the_sals", NML.nml_list),
+        ("num_wq_vars", None),
+        ("wq_names", _nml_str_list),
+        ("wq_init_vals", NML.nml_list)
+    ),
+    "light": (
+        ("light_mode", None),
+        ("Kw", None),
+        ("Kw_file", NML.nml_str),
+        ("n_bands", None),
+        ("light_extc", NML.nml_list),
+        ("energy_frac", NML.nml_list),
+        ("Benthic_Imin", None)
+    ),
+    "bird_model": (
+        ("AP", None),
+        ("Oz", None),
+        ("WatVap", None),
+        ("AOD500", None),
+        ("AOD380", None),
+        ("Albedo", None)
+    ),
+    "sediment": (
+        ("sed_heat_Ksoil", None),
+        ("sed_temp_depth", None),
+        ("sed_temp_mean", NML.nml_list),
+        ("sed_temp_amplitude", NML.nml_list),
+        ("sed_temp_peak_doy", NML.nml_list),
+        ("benthic_mode", None),
+        ("n_zones", None),
+        ("zone_heights", NML.nml_list),
+        ("sed_reflectivity", NML.nml_list),
+        ("sed_roughness", NML.nml_list)
+    ),
+    "snowice": (
+        ("snow_albedo_factor", None),
+        ("snow_rho_min", None),
+        ("snow_rho_max", None)
+    ),
+    "meteorology": (
+        ("met_sw", NML.nml_bool),
+        ("meteo_fl", NML.nml_str),
+        ("subdaily", NML.nml_bool),
+        ("time_fmt", NML.nml_str),
+        ("rad_mode", None),
+        ("albedo_mode", None),
+        ("sw_factor", None),
+        ("lw_type", NML.nml_str),
+        ("cloud_mode", None),
+        ("lw_factor", None),
+        ("atm_stab", None),
+        ("rh_factor", None),
+        ("at_factor", None),
+        ("ce", None),
+        ("ch", None),
+        ("rain_sw", NML.nml_bool),
+        ("rain_factor", None),
+        ("catchrain", NML.nml_bool),
+        ("rain_threshold", None),
+        ("runoff_coef", None),
+        ("cd", None),
+        ("wind_factor", None),
+        ("fetch_mode", None),
+        ("Aws", None),
+        ("Xws", None),
+        ("num_dir", None),
+        ("wind_dir", None),
+        ("fetch_scale", None)
+    ),
+    "inflow": (
+        ("num_inflows", None),
+        ("names_of_strms", _nml_str_list),
+        ("subm_flag", _nml_bool_list),
+        ("strm_hf_angle", NML.nml_list),
+        ("strmbd_slope", NML.nml_list),
+        ("strmbd_drag", NML.nml_list),
+        ("coef_inf_entrain", NML.nml_list),
+        ("inflow_factor", NML.nml_list),
+        ("inflow_fl", _nml_str_list),
+        ("inflow_varnum", None),
+        ("inflow_vars", _nml_str_list),
+        ("time_fmt", NML.nml_str)
+    ),
+    "outflow": (
+        ("num_outlet", None),
+        ("outflow_fl", NML.nml_str),
+        ("time_fmt", NML.nml_str),
+        ("outflow_factor", NML.nml_list),
+        ("outflow_thick_limit", NML.nml_list),
+        ("single_layer_draw", _nml_bool_list),
+        ("flt_off_sw", _nml_bool_list),
+        ("outlet_type", NML.nml_list),
+        ("outl_elvs", NML.nml_list),
+        ("bsn_len_outl", NML.nml_list),
+        ("bsn_wid_outl", NML.nml_list),
+        ("crit_O2", None),
+        ("crit_O2_dep", None),
+        ("crit_O2_days", None),
+        ("outlet_crit", None),
+        ("O2name", NML.nml_str),
+        ("O2idx", NML.nml_str),
+        ("target_temp", None),
+        ("min_lake_temp", None),
+        ("fac_range_upper", None),
+        ("fac_range_lower", None),
+        ("mix_withdraw", NML.nml_bool),
+        ("coupl_oxy_sw", NML.nml_bool),
+        ("withdrTemp_fl", NML.nml_str),
+        ("seepage", NML.nml_bool),
+        ("seepage_rate", None),
+        ("crest_width", None),
+        ("crest_factor", None)
+    )
+}
+
+# Opening line of each configuration block and the line that closes every
+# block.
+_NML_BLOCK_HEADERS = {
+    block_name: f"&{block_name}\n" for block_name in _NML_BLOCK_PARAMS
+}
+_NML_BLOCK_FOOTER = "/"
+
+# `_NML_BLOCK_PARAMS` with the start of each parameter's line, e.g.
+# `"   sim_name = "`, built once rather than formatted for every line.
+_NML_BLOCK_LINES = {
+    block_name: tuple(
+        (param, f"   {param} = ", syntax_func)
+        for param, syntax_func in block_params
+    )
+    for block_name, block_params in _NML_BLOCK_PARAMS.items()
+}
 
 class NMLBase:
     """
     Base class for all `nml.NML*` classes.
+
+    Subclasses declare their model parameters in `__slots__` so instances do
+    not carry a per-instance `__dict__`.
     """
+    __slots__ = ()
+
+    # Parameters that GLM expects as a comma-separated list. Single values
+    # are wrapped in a list by `_to_dict()`.
+    _list_params = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Model parameters of the subclass, taken once from its `__init__()`
+        # signature. `_params` keeps their order for `_to_dict()` and 
+        # `_param_names` is used to validate `set_attributes()`.
+        cls._params = tuple(
+            inspect.signature(cls.__init__).parameters
+        )[1:]
+        cls._param_names = frozenset(cls._params)
+
     def set_attributes(self, attrs_dict: dict):
         """Set attributes for an instance of a `nml.NML*` class.
         
@@ -736,7 +621,8 @@ class NMLBase:
         ----------
         attrs_dict: dict
             A dictionary of GLM parameters to set the respective attributes in 
-            a `nml.NML*` class instance.
+            a `nml.NML*` class instance. Raises a `ValueError` if a key is not
+            a parameter of the class.
 
         Examples
         --------
@@ -753,9 +639,44 @@ class NMLBase:
         >>> glm_setup = nml.NMLGLMSetup()
         >>> glm_setup.set_attributes(glm_setup_attrs)
         """
+        invalid_params = attrs_dict.keys() - self._param_names
+        if invalid_params:
+            raise ValueError(
+                f"Invalid parameters for {type(self).__name__}: "
+                f"{sorted(invalid_params)}."
+            )
         for key, value in attrs_dict.items():
             setattr(self, key, value)
 
+    def _to_dict(self, check_errors: bool) -> dict[str, Any]:
+        """Consolidate the model parameters into a dictionary.
+
+        Shared implementation of the `__call__()` method of `nml.NML*` 
+        classes. Converts the parameters listed in `_list_params` with 
+        `_single_value_to_list()` and returns the parameters in the order of
+        the `__init__()` signature. Private method for use in `nml.NML*` 
+        classes.
+
+        Parameters
+        ----------
+        check_errors : bool
+            If `True`, warns that error checking is not yet stable.
+        """
+        for param in self._list_params:
+            setattr(
+                self, param, self._single_value_to_list(getattr(self, param))
+            )
+
+        if check_errors:
+            warnings.warn(
+                "Error checking is not stable and lacks complete coverage. "
+                "Erroneous parameters may not be raised.",
+                category=FutureWarning,
+                stacklevel=3
+            )
+
+        return {param: getattr(self, param) for param in self._params}
+
     def _single_value_to_list(
             self, 
             value: Any
@@ -771,15 +692,21 @@ class NMLBase:
         respectively. When setting attributes of `NMLOutput()`, 
         `csv_point_vars='temp'` is preferrable to `csv_point_vars=['temp']`. 
         The `_single_value_to_list` method will convert the value to a python 
-        list providing it is not `None`. Private method for use in `nml.NML*` 
-        classes.
+        list providing it is not `None`. Tuples and NumPy arrays, e.g., from 
+        `np.linspace()`, are converted to a list of their items. A 0-d NumPy 
+        array is treated as a single value. Private method for use in 
+        `nml.NML*` classes.
 
         Parameters
         ----------
         value: Any
             The value to convert to a list.
         """
-        if not isinstance(value, list) and value is not None:
+        if isinstance(value, np.ndarray):
+            list_value = np.atleast_1d(value).tolist()
+        elif isinstance(value, tuple):
+            list_value = list(value)
+        elif not isinstance(value, list) and value is not None:
             list_value = [value]
         else:
             list_value = value
@@ -833,6 +760,11 @@ class NMLGLMSetup(NMLBase):
     ... }
     >>> glm_setup.set_attributes(glm_setup_attrs)
     """
+    __slots__ = (
+        "sim_name", "max_layers", "min_layer_vol", "min_layer_thick",
+        "max_layer_thick", "density_model", "non_avg"
+    )
+
     def __init__(
         self,
         sim_name: Union[str, None] = None,
@@ -893,25 +825,7 @@ class NMLGLMSetup(NMLBase):
             'non_avg': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        glm_setup_dict = {
-            "sim_name": self.sim_name,
-            "max_layers": self.max_layers,
-            "min_layer_vol": self.min_layer_vol,
-            "min_layer_thick": self.min_layer_thick,
-            "max_layer_thick": self.max_layer_thick,
-            "density_model": self.density_model,
-            "non_avg": self.non_avg
-        }
-
-        return glm_setup_dict
+        return self._to_dict(check_errors)
 
 class NMLMixing(NMLBase):
     """Construct the `&mixing` model parameters.
@@ -968,6 +882,11 @@ class NMLMixing(NMLBase):
     ... }
     >>> mixing.set_attributes(mixing_attrs)
     """
+    __slots__ = (
+        "surface_mixing", "coef_mix_conv", "coef_wind_stir", "coef_mix_shear",
+        "coef_mix_turb", "coef_mix_KH", "deep_mixing", "coef_mix_hyp", "diff"
+    )
+
     def __init__(
         self,
         surface_mixing: Union[int, None] = None,
@@ -1034,27 +953,7 @@ class NMLMixing(NMLBase):
             'diff': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        mixing_dict = {
-            "surface_mixing": self.surface_mixing,
-            "coef_mix_conv": self.coef_mix_conv,
-            "coef_wind_stir": self.coef_wind_stir,
-            "coef_mix_shear": self.coef_mix_shear,
-            "coef_mix_turb": self.coef_mix_turb,
-            "coef_mix_KH": self.coef_mix_KH,
-            "deep_mixing": self.deep_mixing,
-            "coef_mix_hyp": self.coef_mix_hyp,
-            "diff": self.diff
-        }
-
-        return mixing_dict
+        return self._to_dict(check_errors)
 
 class NMLWQSetup(NMLBase):
     """Construct the `&wq_setup` model parameters.
@@ -1105,6 +1004,11 @@ class NMLWQSetup(NMLBase):
     ... }
     >>> wq_setup.set_attributes(wq_setup_attrs)
     """
+    __slots__ = (
+        "wq_lib", "wq_nml_file", "bioshade_feedback", "mobility_off",
+        "ode_method", "split_factor", "repair_state"
+    )
+
     def __init__(
         self,
         wq_lib: Union[str, None] = None,
@@ -1165,25 +1069,7 @@ class NMLWQSetup(NMLBase):
             'repair_state': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        wq_setup_dict = {
-            "wq_lib": self.wq_lib,
-            "wq_nml_file": self.wq_nml_file,
-            "bioshade_feedback": self.bioshade_feedback,
-            "mobility_off": self.mobility_off,
-            "ode_method": self.ode_method,
-            "split_factor": self.split_factor,
-            "repair_state": self.repair_state
-        }
-
-        return wq_setup_dict
+        return self._to_dict(check_errors)
 
 class NMLMorphometry(NMLBase):
     """Construct the `&morphometry` model parameters.
@@ -1258,6 +1144,13 @@ class NMLMorphometry(NMLBase):
     ... }
     >>> morphometry.set_attributes(morphometry_attrs)
     """
+    __slots__ = (
+        "lake_name", "latitude", "longitude", "base_elev", "crest_elev",
+        "bsn_len", "bsn_wid", "bsn_vals", "H", "A"
+    )
+
+    _list_params = ("H", "A")
+
     def __init__(
         self,
         lake_name: Union[str, None] = None,
@@ -1327,28 +1220,7 @@ class NMLMorphometry(NMLBase):
             'A': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        morphometry_dict = {
-            "lake_name": self.lake_name,
-            "latitude": self.latitude,
-            "longitude": self.longitude,
-            "base_elev": self.base_elev,
-            "crest_elev": self.crest_elev,
-            "bsn_len": self.bsn_len,
-            "bsn_wid": self.bsn_wid,
-            "bsn_vals": self.bsn_vals,
-            "H": self.H,
-            "A": self.A
-        }
-
-        return morphometry_dict
+        return self._to_dict(check_errors)
 
 class NMLTime(NMLBase):
     """Construct the `&time` model parameters.
@@ -1394,6 +1266,10 @@ class NMLTime(NMLBase):
     ... }
     >>> time.set_attributes(time_attrs)
     """
+    __slots__ = (
+        "timefmt", "start", "stop", "dt", "num_days", "timezone"
+    )
+
     def __init__(
         self,
         timefmt: Union[int, None] = None,
@@ -1451,24 +1327,7 @@ class NMLTime(NMLBase):
         ...     'timezone': None
         ... }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        time_dict = {
-            "timefmt": self.timefmt,
-            "start": self.start,
-            "stop": self.stop,
-            "dt": self.dt,
-            "num_days": self.num_days,
-            "timezone": self.timezone
-        }
-
-        return time_dict    
+        return self._to_dict(check_errors)
     
 class NMLOutput(NMLBase):
     """Construct the `&output` model parameters.
@@ -1549,6 +1408,19 @@ class NMLOutput(NMLBase):
     ... }
     >>> output.set_attributes(output_attrs)
     """
+    __slots__ = (
+        "out_dir", "out_fn", "nsave", "csv_lake_fname", "csv_point_nlevs",
+        "csv_point_fname", "csv_point_frombot", "csv_point_at",
+        "csv_point_nvars", "csv_point_vars", "csv_outlet_allinone",
+        "csv_outlet_fname", "csv_outlet_nvars", "csv_outlet_vars",
+        "csv_ovrflw_fname"
+    )
+
+    _list_params = (
+        "csv_point_frombot", "csv_point_at", "csv_point_vars",
+        "csv_outlet_vars"
+    )
+
     def __init__(
         self,
         out_dir: Union[str, None] = None,
@@ -1635,41 +1507,7 @@ class NMLOutput(NMLBase):
             'csv_ovrflw_fname': None
         }
         """
-
-        self.csv_point_frombot = self._single_value_to_list(
-            self.csv_point_frombot
-        )
-        self.csv_point_at = self._single_value_to_list(self.csv_point_at)
-        self.csv_point_vars = self._single_value_to_list(self.csv_point_vars)    
-        self.csv_outlet_vars = self._single_value_to_list(self.csv_outlet_vars)       
-
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        output_dict = {
-            "out_dir": self.out_dir,
-            "out_fn": self.out_fn,
-            "nsave": self.nsave,
-            "csv_lake_fname": self.csv_lake_fname,
-            "csv_point_nlevs": self.csv_point_nlevs,
-            "csv_point_fname": self.csv_point_fname,
-            "csv_point_frombot": self.csv_point_frombot,
-            "csv_point_at": self.csv_point_at,
-            "csv_point_nvars": self.csv_point_nvars,
-            "csv_point_vars": self.csv_point_vars,
-            "csv_outlet_allinone": self.csv_outlet_allinone,
-            "csv_outlet_fname": self.csv_outlet_fname,
-            "csv_outlet_nvars": self.csv_outlet_nvars,
-            "csv_outlet_vars": self.csv_outlet_vars,
-            "csv_ovrflw_fname": self.csv_ovrflw_fname
-        }
-
-        return output_dict
+        return self._to_dict(check_errors)
 
 class NMLInitProfiles(NMLBase):
     """Construct the `&init_profiles` model parameters.
@@ -1732,6 +1570,15 @@ class NMLInitProfiles(NMLBase):
     ... }
     >>> init_profiles.set_attributes(init_profiles_attrs)
     """
+    __slots__ = (
+        "lake_depth", "num_depths", "the_depths", "the_temps", "the_sals",
+        "num_wq_vars", "wq_names", "wq_init_vals"
+    )
+
+    _list_params = (
+        "the_depths", "the_temps", "the_sals", "wq_names", "wq_init_vals"
+    )
+
     def __init__(
         self,
         lake_depth: Union[float, None] = None,
@@ -1797,32 +1644,7 @@ class NMLInitProfiles(NMLBase):
             'wq_init_vals': None
         }
         """
-        self.the_depths = self._single_value_to_list(self.the_depths)
-        self.the_temps = self._single_value_to_list(self.the_temps)
-        self.the_depths = self._single_value_to_list(self.the_depths)
-        self.wq_names = self._single_value_to_list(self.wq_names)
-        self.wq_init_vals = self._single_value_to_list(self.wq_init_vals)
-
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        init_profiles_dict = {
-            "lake_depth": self.lake_depth,
-            "num_depths": self.num_depths,
-            "the_depths": self.the_depths,
-            "the_temps": self.the_temps,
-            "the_sals": self.the_sals,
-            "num_wq_vars": self.num_wq_vars,
-            "wq_names": self.wq_names,
-            "wq_init_vals": self.wq_init_vals
-        }
-
-        return init_profiles_dict
+        return self._to_dict(check_errors)
     
 class NMLLight(NMLBase):
     """Construct the `&light` model parameters.
@@ -1872,6 +1694,15 @@ class NMLLight(NMLBase):
     ... }
     >>> light.set_attributes(light_attrs)
     """
+    __slots__ = (
+        "light_mode", "Kw", "Kw_file", "n_bands", "light_extc", "energy_frac",
+        "Benthic_Imin"
+    )
+
+    _list_params = (
+        "light_extc", "energy_frac"
+    )
+
     def __init__(
         self,
         light_mode: Union[int, None] = None,
@@ -1931,29 +1762,8 @@ class NMLLight(NMLBase):
             'energy_frac': None, 
             'Benthic_Imin': None
         }
-        """        
-        self.light_extc = self._single_value_to_list(self.light_extc)   
-        self.energy_frac = self._single_value_to_list(self.energy_frac)
-
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        light_dict = {
-            "light_mode": self.light_mode,
-            "Kw": self.Kw,
-            "Kw_file": self.Kw_file,
-            "n_bands": self.n_bands,
-            "light_extc": self.light_extc,
-            "energy_frac": self.energy_frac,
-            "Benthic_Imin": self.Benthic_Imin
-        }     
-
-        return light_dict
+        """
+        return self._to_dict(check_errors)
 
 class NMLBirdModel(NMLBase):
     """Construct the `&bird_model` model parameters.
@@ -1999,6 +1809,10 @@ class NMLBirdModel(NMLBase):
     ... }
     >>> bird_model.set_attributes(bird_model_attrs)
     """
+    __slots__ = (
+        "AP", "Oz", "WatVap", "AOD500", "AOD380", "Albedo"
+    )
+
     def __init__(
         self,
         AP: Union[float, None] = None,
@@ -2056,24 +1870,7 @@ class NMLBirdModel(NMLBase):
             'Albedo': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        bird_model_dict = {
-            "AP": self.AP,
-            "Oz": self.Oz,
-            "WatVap": self.WatVap,
-            "AOD500": self.AOD500,
-            "AOD380": self.AOD380,
-            "Albedo": self.Albedo
-        }
-
-        return bird_model_dict
+        return self._to_dict(check_errors)
     
 class NMLSediment(NMLBase):
     """Construct the `&sediment` model parameters.
@@ -2137,6 +1934,17 @@ class NMLSediment(NMLBase):
     ... }
     >>> sediment.set_attributes(sediment_attrs)
     """
+    __slots__ = (
+        "sed_heat_Ksoil", "sed_temp_depth", "sed_temp_mean",
+        "sed_temp_amplitude", "sed_temp_peak_doy", "benthic_mode", "n_zones",
+        "zone_heights", "sed_reflectivity", "sed_roughness"
+    )
+
+    _list_params = (
+        "sed_temp_mean", "sed_temp_amplitude", "sed_temp_peak_doy",
+        "zone_heights", "sed_reflectivity", "sed_roughness"
+    )
+
     def __init__(
         self,
         sed_heat_Ksoil: Union[float, None] = None,
@@ -2206,41 +2014,7 @@ class NMLSediment(NMLBase):
             'sed_roughness': None
         }
         """
-        self.sed_temp_mean = self._single_value_to_list(self.sed_temp_mean)
-        self.sed_temp_amplitude = self._single_value_to_list(
-            self.sed_temp_amplitude
-        )
-        self.sed_temp_peak_doy = self._single_value_to_list(
-            self.sed_temp_peak_doy
-        )
-        self.zone_heights = self._single_value_to_list(self.zone_heights)
-        self.sed_reflectivity = self._single_value_to_list(
-            self.sed_reflectivity
-        )
-        self.sed_roughness = self._single_value_to_list(self.sed_roughness)
-
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        sediment_dict = {
-            "sed_heat_Ksoil": self.sed_heat_Ksoil,
-            "sed_temp_depth": self.sed_temp_depth,
-            "sed_temp_mean": self.sed_temp_mean,
-            "sed_temp_amplitude": self.sed_temp_amplitude,
-            "sed_temp_peak_doy": self.sed_temp_peak_doy,
-            "benthic_mode": self.benthic_mode,
-            "n_zones": self.n_zones,
-            "zone_heights": self.zone_heights,
-            "sed_reflectivity": self.sed_reflectivity,
-            "sed_roughness": self.sed_roughness
-        }
-
-        return sediment_dict
+        return self._to_dict(check_errors)
 
 class NMLSnowIce(NMLBase):
     """Construct the `&snowice` model parameters.
@@ -2275,6 +2049,10 @@ class NMLSnowIce(NMLBase):
     ... }
     >>> snow_ice.set_attributes(snow_ice_attrs)
     """
+    __slots__ = (
+        "snow_albedo_factor", "snow_rho_min", "snow_rho_max"
+    )
+
     def __init__(
         self,
         snow_albedo_factor: Union[float, None] = None,
@@ -2323,21 +2101,7 @@ class NMLSnowIce(NMLBase):
             'snow_rho_max': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        snowice_dict = {
-            "snow_albedo_factor": self.snow_albedo_factor,
-            "snow_rho_min": self.snow_rho_min,
-            "snow_rho_max": self.snow_rho_max
-        }
-
-        return snowice_dict
+        return self._to_dict(check_errors)
 
 class NMLMeteorology(NMLBase):
     """Construct the `&meteorology` model parameters.
@@ -2466,6 +2230,15 @@ class NMLMeteorology(NMLBase):
     ... }
     >>> meteorology.set_attributes(meteorology_attrs)
     """
+    __slots__ = (
+        "met_sw", "meteo_fl", "subdaily", "time_fmt", "rad_mode",
+        "albedo_mode", "sw_factor", "lw_type", "cloud_mode", "lw_factor",
+        "atm_stab", "rh_factor", "at_factor", "ce", "ch", "rain_sw",
+        "rain_factor", "catchrain", "rain_threshold", "runoff_coef", "cd",
+        "wind_factor", "fetch_mode", "Aws", "Xws", "num_dir", "wind_dir",
+        "fetch_scale"
+    )
+
     def __init__(
         self,
         met_sw: Union[bool, None] = None,
@@ -2589,46 +2362,7 @@ class NMLMeteorology(NMLBase):
             'fetch_scale': None
         }
         """
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        meteorology_dict = {
-            "met_sw": self.met_sw,
-            "meteo_fl": self.meteo_fl,
-            "subdaily": self.subdaily,
-            "time_fmt": self.time_fmt,
-            "rad_mode": self.rad_mode,
-            "albedo_mode": self.albedo_mode,
-            "sw_factor": self.sw_factor,
-            "lw_type": self.lw_type,
-            "cloud_mode": self.cloud_mode,
-            "lw_factor": self.lw_factor,
-            "atm_stab": self.atm_stab,
-            "rh_factor": self.rh_factor,
-            "at_factor": self.at_factor,
-            "ce": self.ce,
-            "ch": self.ch,
-            "rain_sw": self.rain_sw,
-            "rain_factor": self.rain_factor,
-            "catchrain": self.catchrain,
-            "rain_threshold": self.rain_threshold,
-            "runoff_coef": self.runoff_coef,
-            "cd": self.cd,
-            "wind_factor": self.wind_factor,
-            "fetch_mode": self.fetch_mode,
-            "Aws": self.Aws,
-            "Xws": self.Xws,
-            "num_dir": self.num_dir,
-            "wind_dir": self.wind_dir,
-            "fetch_scale": self.fetch_scale
-        }
-
-        return meteorology_dict
+        return self._to_dict(check_errors)
 
 class NMLInflow(NMLBase):
     """Construct the `&inflow` model parameters.
@@ -2706,6 +2440,18 @@ class NMLInflow(NMLBase):
     >>> inflow.set_attributes(inflow_attrs)
     """
 
+    __slots__ = (
+        "num_inflows", "names_of_strms", "subm_flag", "strm_hf_angle",
+        "strmbd_slope", "strmbd_drag", "coef_inf_entrain", "inflow_factor",
+        "inflow_fl", "inflow_varnum", "inflow_vars", "time_fmt"
+    )
+
+    _list_params = (
+        "names_of_strms", "subm_flag", "strm_hf_angle", "strmbd_slope",
+        "strmbd_drag", "coef_inf_entrain", "inflow_factor", "inflow_fl",
+        "inflow_vars"
+    )
+
     def __init__(
         self,
         num_inflows: Union[int, None] = None,
@@ -2794,42 +2540,7 @@ class NMLInflow(NMLBase):
             'time_fmt': None
         }
         """
-        self.names_of_strms = self._single_value_to_list(self.names_of_strms)
-        self.subm_flag = self._single_value_to_list(self.subm_flag)
-        self.strm_hf_angle = self._single_value_to_list(self.strm_hf_angle)
-        self.strmbd_slope = self._single_value_to_list(self.strmbd_slope)
-        self.strmbd_drag = self._single_value_to_list(self.strmbd_drag)
-        self.coef_inf_entrain = self._single_value_to_list(
-            self.coef_inf_entrain
-        )
-        self.inflow_factor = self._single_value_to_list(self.inflow_factor)
-        self.inflow_fl = self._single_value_to_list(self.inflow_fl)
-        self.inflow_vars = self._single_value_to_list(self.inflow_vars)
-
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )     
-
-        inflow_dict = {
-            "num_inflows": self.num_inflows,
-            "names_of_strms": self.names_of_strms,
-            "subm_flag": self.subm_flag,
-            "strm_hf_angle": self.strm_hf_angle,
-            "strmbd_slope": self.strmbd_slope,
-            "strmbd_drag": self.strmbd_drag,
-            "coef_inf_entrain": self.coef_inf_entrain,
-            "inflow_factor": self.inflow_factor,
-            "inflow_fl": self.inflow_fl,
-            "inflow_varnum": self.inflow_varnum,
-            "inflow_vars": self.inflow_vars,
-            "time_fmt": self.time_fmt
-        }
-
-        return inflow_dict
+        return self._to_dict(check_errors)
 
 class NMLOutflow(NMLBase):
     """Construct the `&outflow` model parameters.
@@ -2941,6 +2652,22 @@ class NMLOutflow(NMLBase):
     ... }
     >>> outflow.set_attributes(outflow_attrs)
     """
+    __slots__ = (
+        "num_outlet", "outflow_fl", "time_fmt", "outflow_factor",
+        "outflow_thick_limit", "single_layer_draw", "flt_off_sw",
+        "outlet_type", "outl_elvs", "bsn_len_outl", "bsn_wid_outl", "crit_O2",
+        "crit_O2_dep", "crit_O2_days", "outlet_crit", "O2name", "O2idx",
+        "target_temp", "min_lake_temp", "fac_range_upper", "fac_range_lower",
+        "mix_withdraw", "coupl_oxy_sw", "withdrTemp_fl", "seepage",
+        "seepage_rate", "crest_width", "crest_factor"
+    )
+
+    _list_params = (
+        "outflow_factor", "outflow_thick_limit", "single_layer_draw",
+        "flt_off_sw", "outlet_type", "outl_elvs", "bsn_len_outl",
+        "bsn_wid_outl"
+    )
+
     def __init__(
         self,
         num_outlet: Union[int, None] = None,
@@ -3071,56 +2798,4 @@ class NMLOutflow(NMLBase):
             'crest_factor': None
         }
         """
-        self.outflow_factor = self._single_value_to_list(self.outflow_factor)
-        self.outflow_thick_limit = self._single_value_to_list(
-            self.outflow_thick_limit
-        )
-        self.single_layer_draw = self._single_value_to_list(
-            self.single_layer_draw
-        )
-        self.flt_off_sw = self._single_value_to_list(self.flt_off_sw)
-        self.outlet_type = self._single_value_to_list(self.outlet_type)
-        self.outl_elvs = self._single_value_to_list(self.outl_elvs)
-        self.bsn_len_outl = self._single_value_to_list(self.bsn_len_outl)
-        self.bsn_wid_outl = self._single_value_to_list(self.bsn_wid_outl)
-
-        if check_errors:
-            warnings.warn(
-                "Error checking is not stable and lacks complete coverage. "
-                "Erroneous parameters may not be raised.",
-                category=FutureWarning,
-                stacklevel=2
-            )
-
-        outflow_dict = {
-            "num_outlet": self.num_outlet,
-            "outflow_fl": self.outflow_fl,
-            "time_fmt": self.time_fmt,
-            "outflow_factor": self.outflow_factor,
-            "outflow_thick_limit": self.outflow_thick_limit,
-            "single_layer_draw": self.single_layer_draw,
-            "flt_off_sw": self.flt_off_sw,
-            "outlet_type": self.outlet_type,
-            "outl_elvs": self.outl_elvs,
-            "bsn_len_outl": self.bsn_len_outl,
-            "bsn_wid_outl": self.bsn_wid_outl,
-            "crit_O2": self.crit_O2,
-            "crit_O2_dep": self.crit_O2_dep,
-            "crit_O2_days": self.crit_O2_days,
-            "outlet_crit": self.outlet_crit,
-            "O2name": self.O2name,
-            "O2idx": self.O2idx,
-            "target_temp": self.target_temp,
-            "min_lake_temp": self.min_lake_temp,
-            "fac_range_upper": self.fac_range_upper,
-            "fac_range_lower": self.fac_range_lower,
-            "mix_withdraw": self.mix_withdraw,
-            "coupl_oxy_sw": self.coupl_oxy_sw,
-            "withdrTemp_fl": self.withdrTemp_fl,
-            "seepage": self.seepage,
-            "seepage_rate": self.seepage_rate,
-            "crest_width": self.crest_width,
-            "crest_factor": self.crest_factor
-        }
-
-        return outflow_dict
\ No newline at end of file
+        return self._to_dict(check_errors)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from glmpy import nml
 
@@ -28,6 +29,22 @@ def test_nml_list(python_syntax, nml_syntax, syntax_func):
         syntax_func=syntax_func
     ) == nml_syntax
 
+@pytest.mark.parametrize("python_list", [
+    [], ['temp'], ['temp', 'salt', 'oxy'], np.array(['temp', 'salt'])
+])
+def test_nml_str_list(python_list):
+    assert nml._nml_str_list(python_list) == nml.NML.nml_list(
+        python_list, syntax_func=nml.NML.nml_str
+    )
+
+@pytest.mark.parametrize("python_list", [
+    [], [True], [True, False, True]
+])
+def test_nml_bool_list(python_list):
+    assert nml._nml_bool_list(python_list) == nml.NML.nml_list(
+        python_list, syntax_func=nml.NML.nml_bool
+    )
+
 @pytest.fixture
 def example_glmpy_parameters():
     return {
@@ -116,6 +133,13 @@ def example_glm_setup_parameters():
         "non_avg": False
     }
 
+def test_set_attributes_invalid_param(example_glm_setup_parameters):
+    glm_setup = nml.NMLGLMSetup()
+    attrs = dict(example_glm_setup_parameters, densty_model=1)
+    with pytest.raises(ValueError, match="densty_model"):
+        glm_setup.set_attributes(attrs)
+    assert glm_setup.sim_name is None
+
 def test_write_nml_glm_setup(example_glm_setup_parameters):
     glm_setup = nml.NMLGLMSetup()
     glm_setup.set_attributes(example_glm_setup_parameters)
@@ -125,7 +149,7 @@ def test_write_nml_glm_setup(example_glm_setup_parameters):
         time={},
         init_profiles={}
     )
-    glm_setup_str = my_nml._write_nml_glm_setup(glm_setup())
+    glm_setup_str = my_nml._write_nml_block("glm_setup", glm_setup())
     expected = (
         "&glm_setup\n" +
         f"   sim_name = 'Example Simulation #1'\n" +
@@ -163,7 +187,7 @@ def test_write_nml_mixing(example_mixing_parameters):
         time={},
         init_profiles={}
     )
-    mixing_str = my_nml._write_nml_mixing(mixing())
+    mixing_str = my_nml._write_nml_block("mixing", mixing())
     expected = (
         "&mixing\n" +
         f"   surface_mixing = 1\n" +
@@ -200,7 +224,7 @@ def test_write_wq_setup(example_wq_setup_parameters):
         time={},
         init_profiles={}
     )
-    wq_setup_str = my_nml._write_nml_wq_setup(wq_setup())
+    wq_setup_str = my_nml._write_nml_block("wq_setup", wq_setup())
     expected = (
         "&wq_setup\n" +
         f"   wq_lib = 'aed2'\n" +
@@ -254,7 +278,7 @@ def test_write_morphometry(example_morphometry_parameters):
         time={},
         init_profiles={}
     )
-    morphometry_str = my_nml._write_nml_morphometry(morphometry())
+    morphometry_str = my_nml._write_nml_block("morphometry", morphometry())
     expected = (
         "&morphometry\n" +
         f"   lake_name = 'Example Lake'\n" +
@@ -304,7 +328,7 @@ def test_write_time(example_time_parameters):
         time={},
         init_profiles={}
     )
-    time_str = my_nml._write_nml_time(time())
+    time_str = my_nml._write_nml_block("time", time())
     expected = (
         "&time\n" +
         f"   timefmt = 3\n" +
@@ -348,7 +372,7 @@ def test_write_output(example_output_parameters):
         time={},
         init_profiles={}
     )
-    output_str = my_nml._write_nml_output(output())
+    output_str = my_nml._write_nml_block("output", output())
     expected = (
         "&output\n" +
         f"   out_dir = 'output'\n" +
@@ -402,7 +426,9 @@ def test_write_init_profiles(example_init_profiles_parameters):
         time={},
         init_profiles={}
     )
-    init_profiles_str = my_nml._write_nml_init_profiles(init_profiles())
+    init_profiles_str = my_nml._write_nml_block(
+        "init_profiles", init_profiles()
+    )
     expected = (
         "&init_profiles\n" +
         f"   lake_depth = 43\n" +
@@ -423,6 +449,39 @@ def test_write_init_profiles(example_init_profiles_parameters):
     )
     assert init_profiles_str == expected
 
+def test_init_profiles_single_values():
+    init_profiles = nml.NMLInitProfiles(
+        the_depths=1, the_temps=18.0, the_sals=0.5
+    )
+    init_profiles_dict = init_profiles()
+    assert init_profiles_dict["the_depths"] == [1]
+    assert init_profiles_dict["the_temps"] == [18.0]
+    assert init_profiles_dict["the_sals"] == [0.5]
+
+def test_init_profiles_array_values():
+    init_profiles = nml.NMLInitProfiles(
+        the_depths=np.array([1, 20, 40]),
+        the_temps=(18.0, 18.0, 18.0),
+        the_sals=np.linspace(0.5, 0.5, 3)
+    )
+    init_profiles_dict = init_profiles()
+    assert init_profiles_dict["the_depths"] == [1, 20, 40]
+    assert init_profiles_dict["the_temps"] == [18.0, 18.0, 18.0]
+    assert init_profiles_dict["the_sals"] == [0.5, 0.5, 0.5]
+    assert nml.NML.nml_list(init_profiles_dict["the_depths"]) == "1,20,40"
+
+    init_profiles = nml.NMLInitProfiles(the_sals=np.array(0.5))
+    assert init_profiles()["the_sals"] == [0.5]
+
+def test_morphometry_array_values():
+    morphometry = nml.NMLMorphometry(
+        H=np.array([-6.0, -3.0, 0.0]),
+        A=(16.0, 484.0, 1600.0)
+    )
+    morphometry_dict = morphometry()
+    assert morphometry_dict["H"] == [-6.0, -3.0, 0.0]
+    assert morphometry_dict["A"] == [16.0, 484.0, 1600.0]
+
 @pytest.fixture
 def example_light_parameters():
     return {
@@ -443,7 +502,7 @@ def test_write_light(example_light_parameters):
         time={},
         init_profiles={}
     )
-    light_str = my_nml._write_nml_light(light())
+    light_str = my_nml._write_nml_block("light", light())
     expected = (
         "&light\n" +
         f"   light_mode = 0\n" +
@@ -476,7 +535,7 @@ def test_write_bird_model(example_bird_model_parameters):
         time={},
         init_profiles={}
     )
-    bird_model_str = my_nml._write_nml_bird_model(bird_model())
+    bird_model_str = my_nml._write_nml_block("bird_model", bird_model())
     expected = (
         "&bird_model\n" +
         f"   AP = 973\n" +
@@ -513,7 +572,7 @@ def test_write_sediment(example_sediment_parameters):
         time={},
         init_profiles={}
     )
-    sediment_str = my_nml._write_nml_sediment(sediment())
+    sediment_str = my_nml._write_nml_block("sediment", sediment())
     expected = (
         "&sediment\n" +
         f"   sed_heat_Ksoil = 0.0\n" +
@@ -547,7 +606,7 @@ def test_write_snow_ice(example_snow_ice_parameters):
         time={},
         init_profiles={}
     )
-    snow_ice_str = my_nml._write_nml_snow_ice(snow_ice())
+    snow_ice_str = my_nml._write_nml_block("snowice", snow_ice())
     expected = (
         "&snowice\n" +
         f"   snow_albedo_factor = 1.0\n" +
@@ -588,7 +647,7 @@ def test_write_meteorology(example_meteorology_parameters):
         time={},
         init_profiles={}
     )
-    meteorology_str = my_nml._write_nml_meteorology(meteorology())
+    meteorology_str = my_nml._write_nml_block("meteorology", meteorology())
     expected = (
         "&meteorology\n" +
         f"   met_sw = .true.\n" +
@@ -643,7 +702,7 @@ def test_write_inflow(example_inflow_parameters):
         time={},
         init_profiles={}
     )
-    inflow_str = my_nml._write_nml_inflow(inflow())
+    inflow_str = my_nml._write_nml_block("inflow", inflow())
     expected = (
         "&inflow\n" +
         f"   num_inflows = 6\n" +
@@ -690,7 +749,7 @@ def test_write_outflow(example_outflow_parameters):
         time={},
         init_profiles={}
     )
-    outflow_str = my_nml._write_nml_outflow(outflow())
+    outflow_str = my_nml._write_nml_block("outflow", outflow())
     expected = (
         "&outflow\n" +
         f"   num_outlet = 1\n" +
@@ -972,3 +1031,22 @@ def test_write_nml(
     )
     assert content == expected
 
+def test_write_nml_render_error_keeps_file(
+        tmp_path,
+        example_glm_setup_parameters
+):
+    glm_setup = nml.NMLGLMSetup()
+    glm_setup.set_attributes(example_glm_setup_parameters)
+    file_path = tmp_path / "test.nml"
+    file_path.write_text("existing")
+
+    nml_file = nml.NML(
+        glm_setup=glm_setup(),
+        morphometry=nml.NMLMorphometry()(),
+        time=nml.NMLTime()(),
+        init_profiles={"lake_depth": 1}
+    )
+    with pytest.raises(KeyError):
+        nml_file.write_nml(file_path)
+
+    assert file_path.read_text() == "existing"